@@ -20,13 +20,9 @@ def Frenet_to_cylindrical_residual_func(phi0, phi_target, qsc):
     """
     sinphi0 = np.sin(phi0)
     cosphi0 = np.cos(phi0)
-    R0_at_phi0   = qsc.R0_func(phi0)
-    X_at_phi0    = qsc.X_spline(phi0)
-    Y_at_phi0    = qsc.Y_spline(phi0)
-    normal_R     = qsc.normal_R_spline(phi0)
-    normal_phi   = qsc.normal_phi_spline(phi0)
-    binormal_R   = qsc.binormal_R_spline(phi0)
-    binormal_phi = qsc.binormal_phi_spline(phi0)
+    R0_at_phi0, _, normal_R, normal_phi, _, binormal_R, binormal_phi, _, \
+        tangent_R, tangent_phi, _ = qsc.frenet_frame_spline(phi0)
+    X_at_phi0, Y_at_phi0, Z_at_phi0 = qsc.XYZ_spline(phi0)
 
     normal_x   =   normal_R * cosphi0 -   normal_phi * sinphi0
     normal_y   =   normal_R * sinphi0 +   normal_phi * cosphi0
@@ -37,10 +33,6 @@ def Frenet_to_cylindrical_residual_func(phi0, phi_target, qsc):
     total_y = R0_at_phi0 * sinphi0 + X_at_phi0 * normal_y + Y_at_phi0 * binormal_y
 
     if qsc.order != 'r1':
-        Z_at_phi0    = qsc.Z_spline(phi0)
-        tangent_R    = qsc.tangent_R_spline(phi0)
-        tangent_phi  = qsc.tangent_phi_spline(phi0)
-
         tangent_x = tangent_R * cosphi0 - tangent_phi * sinphi0
         tangent_y = tangent_R * sinphi0 + tangent_phi * cosphi0
 
@@ -64,17 +56,9 @@ def Frenet_to_cylindrical_1_point(phi0, qsc):
     """
     sinphi0 = np.sin(phi0)
     cosphi0 = np.cos(phi0)
-    R0_at_phi0   = qsc.R0_func(phi0)
-    z0_at_phi0   = qsc.Z0_func(phi0)
-    X_at_phi0    = qsc.X_spline(phi0)
-    Y_at_phi0    = qsc.Y_spline(phi0)
-    Z_at_phi0    = qsc.Z_spline(phi0)
-    normal_R     = qsc.normal_R_spline(phi0)
-    normal_phi   = qsc.normal_phi_spline(phi0)
-    normal_z     = qsc.normal_z_spline(phi0)
-    binormal_R   = qsc.binormal_R_spline(phi0)
-    binormal_phi = qsc.binormal_phi_spline(phi0)
-    binormal_z   = qsc.binormal_z_spline(phi0)
+    R0_at_phi0, z0_at_phi0, normal_R, normal_phi, normal_z, binormal_R, binormal_phi, binormal_z, \
+        tangent_R, tangent_phi, tangent_z = qsc.frenet_frame_spline(phi0)
+    X_at_phi0, Y_at_phi0, Z_at_phi0 = qsc.XYZ_spline(phi0)
 
     normal_x   =   normal_R * cosphi0 -   normal_phi * sinphi0
     normal_y   =   normal_R * sinphi0 +   normal_phi * cosphi0
@@ -87,10 +71,6 @@ def Frenet_to_cylindrical_1_point(phi0, qsc):
     total_z = z0_at_phi0           + X_at_phi0 * normal_z + Y_at_phi0 * binormal_z
 
     if qsc.order != 'r1':
-        tangent_R   = qsc.tangent_R_spline(phi0)
-        tangent_phi = qsc.tangent_phi_spline(phi0)
-        tangent_z   = qsc.tangent_z_spline(phi0)
-
         tangent_x = tangent_R * cosphi0 - tangent_phi * sinphi0
         tangent_y = tangent_R * sinphi0 + tangent_phi * cosphi0
 
@@ -122,7 +102,14 @@ def Frenet_to_cylindrical(self, r, ntheta=20):
 
     Returns: 3 element tuple containing ``(R, Z, phi0)``. Each entry has shape ``(ntheta, nphi)``.
 
+    The result is cached for each ``(r, ntheta)``, so repeated calls
+    (e.g. from ``get_boundary`` and ``to_vmec``) do not repeat the root
+    solves. The cache is cleared whenever the configuration is recalculated.
     """
+    key = (r, ntheta)
+    if key in self._Frenet_to_cylindrical_cache:
+        return tuple(np.copy(a) for a in self._Frenet_to_cylindrical_cache[key])
+
     nphi_conversion = self.nphi
     theta = np.linspace(0,2*np.pi,ntheta,endpoint=False)
     phi_conversion = np.linspace(0,2*np.pi/self.nfp,nphi_conversion,endpoint=False)
@@ -144,8 +131,6 @@ def Frenet_to_cylindrical(self, r, ntheta=20):
             Z_at_this_theta += r * r * (self.Z20_untwisted + self.Z2c_untwisted * cos2theta + self.Z2s_untwisted * sin2theta)
             if self.order == 'r3':
                 # We need O(r^3) terms:
-                costheta  = np.cos(theta[j_theta])
-                sintheta  = np.sin(theta[j_theta])
                 cos3theta = np.cos(3 * theta[j_theta])
                 sin3theta = np.sin(3 * theta[j_theta])
                 r3 = r * r * r
@@ -155,9 +140,7 @@ def Frenet_to_cylindrical(self, r, ntheta=20):
                                          + self.Y3c3_untwisted * cos3theta + self.Y3s3_untwisted * sin3theta)
                 Z_at_this_theta += r3 * (self.Z3c1_untwisted * costheta + self.Z3s1_untwisted * sintheta
                                          + self.Z3c3_untwisted * cos3theta + self.Z3s3_untwisted * sin3theta)
-        self.X_spline = self.convert_to_spline(X_at_this_theta)
-        self.Y_spline = self.convert_to_spline(Y_at_this_theta)
-        self.Z_spline = self.convert_to_spline(Z_at_this_theta)
+        self.XYZ_spline = self.convert_to_spline(np.column_stack((X_at_this_theta, Y_at_this_theta, Z_at_this_theta)))
         for j_phi in range(nphi_conversion):
             # Solve for the phi0 such that r0 + X1 n + Y1 b has the desired phi
             phi_target = phi_conversion[j_phi]
@@ -170,7 +153,8 @@ def Frenet_to_cylindrical(self, r, ntheta=20):
             R_2D[j_theta,j_phi] = final_R
             Z_2D[j_theta,j_phi] = final_z
             phi0_2D[j_theta,j_phi] = phi0_solution
-            
+
+    self._Frenet_to_cylindrical_cache[key] = (np.copy(R_2D), np.copy(Z_2D), np.copy(phi0_2D))
     return R_2D, Z_2D, phi0_2D
 
 def to_RZ(self,points):
@@ -215,9 +199,7 @@ def to_RZ(self,points):
                                          + self.Y3c3_untwisted * cos3theta + self.Y3s3_untwisted * sin3theta)
                 Z_at_this_theta += r3 * (self.Z3c1_untwisted * costheta + self.Z3s1_untwisted * sintheta
                                          + self.Z3c3_untwisted * cos3theta + self.Z3s3_untwisted * sin3theta)
-        self.X_spline = self.convert_to_spline(X_at_this_theta)
-        self.Y_spline = self.convert_to_spline(Y_at_this_theta)
-        self.Z_spline = self.convert_to_spline(Z_at_this_theta)
+        self.XYZ_spline = self.convert_to_spline(np.column_stack((X_at_this_theta, Y_at_this_theta, Z_at_this_theta)))
         final_R, final_Z, final_phi = Frenet_to_cylindrical_1_point(phi0, self)
         R.append(final_R)
         Z.append(final_Z)
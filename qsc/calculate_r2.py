@@ -200,6 +200,9 @@ def calculate_r2(self):
     self.beta_1s = beta_1s
     self.B20 = B20
 
+    # Spline interpolants for B20, used by B_mag for plotting:
+    self.build_B20_splines()
+
     # O(r^2) diagnostics:
     self.mercier()
     self.calculate_grad_grad_B_tensor()
@@ -13,10 +13,20 @@ from .util import fourier_minimum
 logger = logging.getLogger(__name__)
 
 # Define periodic spline interpolant conversion used in several scripts and plotting
+# If array is 2D, its first dimension should correspond to phi, and each column is interpolated
 def convert_to_spline(self,array):
-    sp=spline(np.append(self.phi,2*np.pi/self.nfp), np.append(array,array[0]), bc_type='periodic')
+    sp=spline(np.append(self.phi,2*np.pi/self.nfp), np.append(array,[array[0]],axis=0), bc_type='periodic')
     return sp
 
+# Build the spline interpolants of B20 as functions of the cylindrical toroidal
+# angle phi and of the Boozer toroidal angle varphi, used by B_mag. This must be
+# called again whenever self.B20 is overwritten.
+def build_B20_splines(self):
+    self.B20_spline = self.convert_to_spline(self.B20)
+    self.B20_varphi_spline = spline(np.append(self.varphi, 2 * np.pi / self.nfp),
+                                    np.append(self.B20, self.B20[0]),
+                                    bc_type='periodic')
+
 def init_axis(self):
     """
     Initialize the curvature, torsion, differentiation matrix, etc.
@@ -151,12 +161,9 @@ def init_axis(self):
         or self.sigma0 != 0 or (self.order != 'r1' and self.B2s != 0)
 
     # Functions that converts a toroidal angle phi0 on the axis to the axis radial and vertical coordinates
-    self.R0_func = self.convert_to_spline(sum([self.rc[i]*np.cos(i*self.nfp*self.phi) +\
-                                               self.rs[i]*np.sin(i*self.nfp*self.phi) \
-                                              for i in range(len(self.rc))]))
-    self.Z0_func = self.convert_to_spline(sum([self.zc[i]*np.cos(i*self.nfp*self.phi) +\
-                                               self.zs[i]*np.sin(i*self.nfp*self.phi) \
-                                              for i in range(len(self.zs))]))
+    # R0 and Z0 were already evaluated on the phi grid above, so reuse them:
+    self.R0_func = self.convert_to_spline(R0)
+    self.Z0_func = self.convert_to_spline(Z0)
 
     # Spline interpolants for the cylindrical components of the Frenet-Serret frame:
     self.normal_R_spline     = self.convert_to_spline(self.normal_cylindrical[:,0])
@@ -169,5 +176,12 @@ def init_axis(self):
     self.tangent_phi_spline  = self.convert_to_spline(self.tangent_cylindrical[:,1])
     self.tangent_z_spline    = self.convert_to_spline(self.tangent_cylindrical[:,2])
 
+    # Vector-valued spline interpolant for the axis shape and the cylindrical components of the
+    # Frenet-Serret frame, so that Frenet_to_cylindrical evaluates all of them in a single call.
+    # The columns are (R0, Z0, normal, binormal, tangent), each vector ordered as (R, phi, Z).
+    self.frenet_frame_spline = self.convert_to_spline(np.column_stack((R0, Z0, self.normal_cylindrical,
+                                                                       self.binormal_cylindrical,
+                                                                       self.tangent_cylindrical)))
+
     # Spline interpolant for nu = varphi - phi, used for plotting
     self.nu_spline = self.convert_to_spline(self.varphi - self.phi)
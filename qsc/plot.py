@@ -3,7 +3,7 @@ This module contains a function to plot a near-axis surface.
 """
 
 import numpy as np
-from scipy.interpolate import interp2d, interp1d
+from scipy.interpolate import RectBivariateSpline, interp1d
 import matplotlib.pyplot as plt
 from matplotlib import cm
 import matplotlib.colors as clr
@@ -135,7 +135,8 @@ def set_axes_equal(ax):
     ax.set_ylim3d([y_middle - plot_radius, y_middle + plot_radius])
     ax.set_zlim3d([z_middle - plot_radius, z_middle + plot_radius])
 
-def create_subplot(ax, x_2D_plot, y_2D_plot, z_2D_plot, colormap, elev=90, azim=45, dist=7, alpha=1, **kwargs):
+def create_subplot(ax, x_2D_plot, y_2D_plot, z_2D_plot, colormap, elev=90, azim=45, dist=7, alpha=1,
+                   rstride=None, cstride=None, **kwargs):
     '''
     Construct the surface given a surface in cartesian coordinates
     x_2D_plot, y_2D_plot, z_2D_plot already with phi=[0,2*pi].
@@ -151,9 +152,19 @@ def create_subplot(ax, x_2D_plot, y_2D_plot, z_2D_plot, colormap, elev=90, azim=
         azim: azim angle for the camera view
         distance: distance parameter for the camera view
         alpha: opacity of the surface
+        rstride: stride in the theta direction for the drawn polygons.
+          If ``None``, it is chosen so that at least about 75 polygons are drawn in this direction.
+        cstride: stride in the phi direction for the drawn polygons.
+          If ``None``, it is chosen so that at least about 75 polygons are drawn in this direction.
     '''
+    # Drawing one polygon per grid cell dominates the cost of the 3D plot,
+    # so by default coarsen the drawn mesh while keeping the data grid
+    if rstride is None:
+        rstride = max(1, x_2D_plot.shape[0] // 75)
+    if cstride is None:
+        cstride = max(1, x_2D_plot.shape[1] // 75)
     ax.plot_surface(x_2D_plot, y_2D_plot, z_2D_plot, facecolors=colormap,
-                    rstride=1, cstride=1, antialiased=False,
+                    rstride=rstride, cstride=cstride, antialiased=False,
                     linewidth=0, alpha=alpha, shade=False, **kwargs)
     set_axes_equal(ax)
     ax.set_axis_off()
@@ -165,8 +176,8 @@ def create_field_lines(qsc, alphas, X_2D, Y_2D, Z_2D, phimax=2*np.pi, nphi=500):
     '''
     Function to compute the (X, Y, Z) coordinates of field lines at
     several alphas, where alpha = theta-iota*varphi with (theta,varphi)
-    the Boozer toroidal angles. This function relies on a 2D interpolator
-    from the scipy library to smooth out the lines
+    the Boozer toroidal angles. This function relies on a 2D spline
+    interpolator from the scipy library to smooth out the lines
 
     Args:
       qsc: instance of self
@@ -184,18 +195,20 @@ def create_field_lines(qsc, alphas, X_2D, Y_2D, Z_2D, phimax=2*np.pi, nphi=500):
     [ntheta_RZ,nphi_RZ] = X_2D.shape
     phi1D   = np.linspace(0,2*np.pi,nphi_RZ)
     theta1D = np.linspace(0,2*np.pi,ntheta_RZ)
-    X_2D_spline = interp2d(phi1D, theta1D, X_2D, kind='cubic')
-    Y_2D_spline = interp2d(phi1D, theta1D, Y_2D, kind='cubic')
-    Z_2D_spline = interp2d(phi1D, theta1D, Z_2D, kind='cubic')
+    # Bicubic interpolating splines, which can be evaluated at all the
+    # points of a field line in a single vectorized call
+    X_2D_spline = RectBivariateSpline(theta1D, phi1D, X_2D, kx=3, ky=3, s=0)
+    Y_2D_spline = RectBivariateSpline(theta1D, phi1D, Y_2D, kx=3, ky=3, s=0)
+    Z_2D_spline = RectBivariateSpline(theta1D, phi1D, Z_2D, kx=3, ky=3, s=0)
+    # The toroidal angles do not depend on alpha, so compute them once for all field lines
+    period = 2*np.pi
+    phi_mod = np.mod(phi_array,period)
+    varphi0 = qsc.nu_spline(phi_array)+2*phi_array-phi_mod
     for i in range(len(alphas)):
-        for j in range(len(phi_array)):
-            phi_mod = np.mod(phi_array[j],2*np.pi)
-            varphi0=qsc.nu_spline(phi_array[j])+2*phi_array[j]-phi_mod
-            theta_fieldline=qsc.iota*varphi0+alphas[i]
-            theta_fieldline_mod=np.mod(theta_fieldline,2*np.pi)
-            fieldline_X[i,j] = X_2D_spline(phi_mod,theta_fieldline_mod)[0]
-            fieldline_Y[i,j] = Y_2D_spline(phi_mod,theta_fieldline_mod)[0]
-            fieldline_Z[i,j] = Z_2D_spline(phi_mod,theta_fieldline_mod)[0]
+        theta_fieldline_mod = np.mod(qsc.iota*varphi0+alphas[i],period)
+        fieldline_X[i,:] = X_2D_spline.ev(theta_fieldline_mod,phi_mod)
+        fieldline_Y[i,:] = Y_2D_spline.ev(theta_fieldline_mod,phi_mod)
+        fieldline_Z[i,:] = Z_2D_spline.ev(theta_fieldline_mod,phi_mod)
     return fieldline_X, fieldline_Y, fieldline_Z
 
 def create_subplot_mayavi(mlab, R, alphas, x_2D_plot, y_2D_plot, z_2D_plot,
@@ -228,21 +241,17 @@ def create_subplot_mayavi(mlab, R, alphas, x_2D_plot, y_2D_plot, z_2D_plot,
         # z direction and then in the x direction
         rx= R.from_euler('x', degrees_array_x[i], degrees=True)
         rz= R.from_euler('z', degrees_array_z[i], degrees=True)
-        # Initialize rotated arrays
-        x_2D_plot_rotated = np.zeros((x_2D_plot.shape[0],x_2D_plot.shape[1]))
-        y_2D_plot_rotated = np.zeros((x_2D_plot.shape[0],x_2D_plot.shape[1]))
-        z_2D_plot_rotated = np.zeros((x_2D_plot.shape[0],x_2D_plot.shape[1]))
-        fieldline_X_rotated = np.zeros((fieldline_X.shape[0],fieldline_X.shape[1]))
-        fieldline_Y_rotated = np.zeros((fieldline_X.shape[0],fieldline_X.shape[1]))
-        fieldline_Z_rotated = np.zeros((fieldline_X.shape[0],fieldline_X.shape[1]))
+        # Rotating by rz and then by rx is the composed rotation rx * rz,
+        # which is applied to all the points of each array at once
+        rotation = rx * rz
+        def rotate(X, Y, Z):
+            points = np.stack((np.ravel(X), np.ravel(Y), np.ravel(Z)), axis=-1)
+            rotated = np.ascontiguousarray(rotation.apply(points).T).reshape((3,) + np.shape(X))
+            return rotated[0], rotated[1], rotated[2]
         # Rotate surfaces
-        for th in range(x_2D_plot.shape[0]):
-            for ph in range(x_2D_plot.shape[1]):
-                [x_2D_plot_rotated[th,ph], y_2D_plot_rotated[th,ph], z_2D_plot_rotated[th,ph]] = rx.apply(rz.apply(np.array([x_2D_plot[th,ph], y_2D_plot[th,ph], z_2D_plot[th,ph]])))
+        x_2D_plot_rotated, y_2D_plot_rotated, z_2D_plot_rotated = rotate(x_2D_plot, y_2D_plot, z_2D_plot)
         # Rotate field lines
-        for th in range(fieldline_X.shape[0]):
-            for ph in range(fieldline_X.shape[1]):
-                [fieldline_X_rotated[th,ph], fieldline_Y_rotated[th,ph], fieldline_Z_rotated[th,ph]] = rx.apply(rz.apply(np.array([fieldline_X[th,ph], fieldline_Y[th,ph], fieldline_Z[th,ph]])))
+        fieldline_X_rotated, fieldline_Y_rotated, fieldline_Z_rotated = rotate(fieldline_X, fieldline_Y, fieldline_Z)
         # Plot surfaces
         mlab.mesh(x_2D_plot_rotated, y_2D_plot_rotated-shift_array[i], z_2D_plot_rotated, scalars=Bmag, colormap='viridis')
         # Plot field lines
@@ -274,14 +283,21 @@ def get_boundary(self, r=0.1, ntheta=40, nphi=130, ntheta_fourier=20, mpol=13, n
 
     theta1D = np.linspace(0, 2*np.pi, ntheta)
     phi1D = np.linspace(0, 2*np.pi, nphi)
-    phi2D, theta2D = np.meshgrid(phi1D, theta1D)
-    R_2Dnew = np.zeros((ntheta, nphi))
-    Z_2Dnew = np.zeros((ntheta, nphi))
-    for m in range(mpol + 1):
-        for n in range(-ntor, ntor + 1):
-            angle = m * theta2D - n * self.nfp * phi2D
-            R_2Dnew += RBC[n+ntor,m] * np.cos(angle) + RBS[n+ntor,m] * np.sin(angle)
-            Z_2Dnew += ZBC[n+ntor,m] * np.cos(angle) + ZBS[n+ntor,m] * np.sin(angle)
+    # Since cos(m theta - n phi) and sin(m theta - n phi) separate into
+    # products of functions of theta and of phi, the trig functions only
+    # need to be evaluated on the 1D grids, and the sum over (m, n)
+    # reduces to matrix products.
+    mtheta = np.outer(theta1D, np.arange(mpol + 1))
+    nphi_2D = np.outer(np.arange(-ntor, ntor + 1) * self.nfp, phi1D)
+    cos_mtheta = np.cos(mtheta)
+    sin_mtheta = np.sin(mtheta)
+    cos_nphi = np.cos(nphi_2D)
+    sin_nphi = np.sin(nphi_2D)
+    def inverse_Fourier(BC, BS):
+        return (cos_mtheta @ BC.T @ cos_nphi + sin_mtheta @ BC.T @ sin_nphi
+                + sin_mtheta @ BS.T @ cos_nphi - cos_mtheta @ BS.T @ sin_nphi)
+    R_2Dnew = inverse_Fourier(RBC, RBS)
+    Z_2Dnew = inverse_Fourier(ZBC, ZBS)
 
     # X, Y, Z arrays for the whole surface
     x_2D_plot = R_2Dnew * np.cos(phi1D)
@@ -290,6 +306,26 @@ def get_boundary(self, r=0.1, ntheta=40, nphi=130, ntheta_fourier=20, mpol=13, n
 
     return x_2D_plot, y_2D_plot, z_2D_plot, R_2Dnew
 
+def get_boundary_B_mag(qsc, r, ntheta, nphi):
+    '''
+    Function that computes the modulus of the magnetic field B on the
+    (theta,phi) grid used by get_boundary, with theta the Boozer poloidal
+    angle and phi the cylindrical toroidal angle, so that it can be used
+    as the color of the surface
+
+    Args:
+      qsc: instance of self
+      r (float): near-axis radius r of the surface
+      ntheta (int): Number of grid points in the poloidal angle.
+      nphi   (int): Number of grid points in the toroidal angle.
+    '''
+    theta1D = np.linspace(0, 2 * np.pi, ntheta)
+    phi1D = np.linspace(0, 2 * np.pi, nphi)
+    # With a sparse grid, the splines of functions of phi alone are only
+    # evaluated on the nphi points, and B_mag broadcasts to the full grid
+    phi2D, theta2D = np.meshgrid(phi1D, theta1D, sparse=True)
+    return qsc.B_mag(r, theta2D, phi2D)
+
 def plot_boundary(self, r=0.1, ntheta=80, nphi=150, ntheta_fourier=20, nsections=8,
          fieldlines=False, savefig=None, colormap=None, azim_default=None,
          show=True, **kwargs):
@@ -360,6 +396,12 @@ def plot_boundary(self, r=0.1, ntheta=80, nphi=150, ntheta_fourier=20, nsections
     
     ## Poloidal plot
     phi1dplot_RZ = np.linspace(0, 2 * np.pi / self.nfp, nsections, endpoint=False)
+    # Evaluate the axis and the cross-sections at all sections at once;
+    # the loop below only does the plotting
+    R0_sections = self.R0_func(phi1dplot_RZ)
+    Z0_sections = self.Z0_func(phi1dplot_RZ)
+    R_2D_sections = R_2D_spline(phi1dplot_RZ)
+    z_2D_sections = z_2D_spline(phi1dplot_RZ)
     fig = plt.figure(figsize=(6, 6), dpi=80)
     ax  = plt.gca()
     for i, phi in enumerate(phi1dplot_RZ):
@@ -376,9 +418,9 @@ def plot_boundary(self, r=0.1, ntheta=80, nphi=150, ntheta_fourier=20, nsections
             label = '_nolegend_'
         color = get_next_color()
         # Plot location of the axis
-        plt.plot(self.R0_func(phi), self.Z0_func(phi), marker="x", linewidth=2, label=label, color=color)
+        plt.plot(R0_sections[i], Z0_sections[i], marker="x", linewidth=2, label=label, color=color)
         # Plot poloidal cross-section
-        plt.plot(R_2D_spline(phi), z_2D_spline(phi), color=color)
+        plt.plot(R_2D_sections[:, i], z_2D_sections[:, i], color=color)
     plt.xlabel('R (meters)')
     plt.ylabel('Z (meters)')
     plt.legend()
@@ -396,13 +438,10 @@ def plot_boundary(self, r=0.1, ntheta=80, nphi=150, ntheta_fourier=20, nsections
             azim_default = 0
         else:
             azim_default = 45
-    # Define the magnetic field modulus and create its theta,phi array
+    # Define the magnetic field modulus on the same theta,phi grid as the surface
     # The norm instance will be used as the colormap for the surface
-    theta1D = np.linspace(0, 2 * np.pi, ntheta)
-    phi1D = np.linspace(0, 2 * np.pi, nphi)
-    phi2D, theta2D = np.meshgrid(phi1D, theta1D)
+    Bmag = get_boundary_B_mag(self, r=r, ntheta=ntheta, nphi=nphi)
     # Create a color map similar to viridis 
-    Bmag = self.B_mag(r, theta2D, phi2D)
     norm = clr.Normalize(vmin=Bmag.min(), vmax=Bmag.max())
     if fieldlines==False:
         if colormap==None:
@@ -530,10 +569,10 @@ def B_contour(self, r=0.1, ntheta=100, nphi=120, ncontours=10, show=True):
     '''
     theta_array = np.linspace(0, 2 * np.pi, ntheta)
     phi_array = np.linspace(0, 2 * np.pi, nphi)
-    phi_2D, theta_2D = np.meshgrid(phi_array, theta_array)
+    phi_2D, theta_2D = np.meshgrid(phi_array, theta_array, sparse=True)
     magB_2D = self.B_mag(r, theta_2D, phi_2D, Boozer_toroidal=True)
     fig, ax = plt.subplots(1, 1)
-    contourplot = ax.contourf(phi_2D / np.pi, theta_2D / np.pi, magB_2D, ncontours, cmap=cm.plasma)
+    contourplot = ax.contourf(phi_array / np.pi, theta_array / np.pi, magB_2D, ncontours, cmap=cm.plasma)
     fig.colorbar(contourplot)
     ax.set_title('|B| for r=' + str(r))
     ax.set_xlabel(r'$\varphi$')
@@ -682,13 +721,10 @@ def flux_tube(self, r=0.12, alpha=0, delta_r=0.03, delta_alpha=0.2, delta_phi=4*
     '''
 
     x_2D_plot, y_2D_plot, z_2D_plot, R_2D_plot = self.get_boundary(r=r, ntheta=ntheta, nphi=nphi, ntheta_fourier=ntheta_fourier)
-    # Define the magnetic field modulus and create its theta,phi array
+    # Define the magnetic field modulus on the same theta,phi grid as the surface
     # The norm instance will be used as the colormap for the surface
-    theta1D = np.linspace(0, 2 * np.pi, ntheta)
-    phi1D = np.linspace(0, 2 * np.pi, nphi)
-    phi2D, theta2D = np.meshgrid(phi1D, theta1D)
+    Bmag = get_boundary_B_mag(self, r=r, ntheta=ntheta, nphi=nphi)
     # Create a color map similar to viridis 
-    Bmag = self.B_mag(r, theta2D, phi2D)
     norm = clr.Normalize(vmin=Bmag.min(), vmax=Bmag.max())
     cmap = cm.plasma
     # Add a light source so the surface looks brighter
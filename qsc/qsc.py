@@ -18,7 +18,7 @@ class Qsc():
     """
     
     # Import methods that are defined in separate files:
-    from .init_axis import init_axis, convert_to_spline
+    from .init_axis import init_axis, convert_to_spline, build_B20_splines
     from .calculate_r1 import _residual, _jacobian, solve_sigma_equation, \
         _determine_helicity, r1_diagnostics
     from .grad_B_tensor import calculate_grad_B_tensor, calculate_grad_grad_B_tensor, \
@@ -109,6 +109,9 @@ class Qsc():
         """
         Driver for the main calculations.
         """
+        # Surfaces computed by Frenet_to_cylindrical for the previous
+        # configuration are no longer valid:
+        self._Frenet_to_cylindrical_cache = {}
         self.init_axis()
         self.solve_sigma_equation()
         self.r1_diagnostics()
@@ -208,6 +211,8 @@ class Qsc():
                            'sigma', 'curvature', 'torsion', 'X1c', 'Y1c', 'Y1s', 'elongation']]
         if order_r_option != 'r1':
             [read(v) for v in ['X20', 'X2c', 'X2s', 'Y20', 'Y2c', 'Y2s', 'Z20', 'Z2c', 'Z2s', 'B20']]
+            # B20 was overwritten, so the B20 interpolants must be rebuilt:
+            q.build_B20_splines()
             if order_r_option != 'r2':
                 [read(v) for v in ['X3c1', 'Y3c1', 'Y3s1']]
                     
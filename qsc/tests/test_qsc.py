@@ -3,6 +3,7 @@
 import unittest
 import os
 from scipy.io import netcdf
+from scipy.interpolate import CubicSpline
 import numpy as np
 import logging
 from qsc.qsc import Qsc
@@ -250,6 +251,56 @@ class QscTests(unittest.TestCase):
                 np.testing.assert_allclose(z, s2.rs[m:], rtol=rtol, atol=atol)
                 np.testing.assert_allclose(z, s2.zc[m:], rtol=rtol, atol=atol)
                 np.testing.assert_allclose(z, s2.zs[m:], rtol=rtol, atol=atol)
-                
+
+    def test_build_B20_splines(self):
+        """
+        After B20 is overwritten (as in from_cxx) and build_B20_splines is
+        called, B_mag should use splines of the new B20, for both the
+        cylindrical and the Boozer toroidal angle.
+        """
+        stel = Qsc.from_paper('r2 section 5.2')
+        stel.B20 = stel.B20 + 0.3 * np.cos(stel.nfp * stel.phi)
+        stel.build_B20_splines()
+        r = 0.05
+        theta = np.linspace(0, 2 * np.pi, 7)
+        phi = np.linspace(0, 2 * np.pi, 11)
+        phi2D, theta2D = np.meshgrid(phi, theta)
+        B20_phi = CubicSpline(np.append(stel.phi, 2 * np.pi / stel.nfp),
+                              np.append(stel.B20, stel.B20[0]), bc_type='periodic')
+        B20_varphi = CubicSpline(np.append(stel.varphi, 2 * np.pi / stel.nfp),
+                                 np.append(stel.B20, stel.B20[0]), bc_type='periodic')
+        for Boozer_toroidal, B20_spline in [(False, B20_phi), (True, B20_varphi)]:
+            if Boozer_toroidal:
+                thetaN = theta2D - (stel.iota - stel.iotaN) * phi2D
+            else:
+                thetaN = theta2D - (stel.iota - stel.iotaN) * (phi2D + stel.nu_spline(phi2D))
+            B_expected = stel.B0 * (1 + r * stel.etabar * np.cos(thetaN)) \
+                + r * r * (B20_spline(phi2D) + stel.B2c * np.cos(2 * thetaN) + stel.B2s * np.sin(2 * thetaN))
+            np.testing.assert_allclose(stel.B_mag(r, theta2D, phi2D, Boozer_toroidal=Boozer_toroidal),
+                                       B_expected, rtol=1e-13, atol=1e-13)
+
+    def test_Frenet_to_cylindrical_cache(self):
+        """
+        Repeated calls to Frenet_to_cylindrical should return the cached
+        surface, and the cache should be cleared when the configuration
+        is recalculated.
+        """
+        stel = Qsc.from_paper('r1 section 5.1', nphi=31)
+        R_2D, Z_2D, phi0_2D = stel.Frenet_to_cylindrical(0.05, ntheta=10)
+        # Modifying the output should not modify the cache:
+        R_2D[0, 0] = 0
+        R_2D_2, Z_2D_2, phi0_2D_2 = stel.Frenet_to_cylindrical(0.05, ntheta=10)
+        self.assertNotEqual(R_2D_2[0, 0], 0)
+        np.testing.assert_array_equal(Z_2D, Z_2D_2)
+        np.testing.assert_array_equal(phi0_2D, phi0_2D_2)
+        stel.set_dofs(stel.get_dofs() * 1.01)
+        new = Qsc.from_paper('r1 section 5.1', nphi=31)
+        new.set_dofs(stel.get_dofs())
+        R_2D_3, Z_2D_3, _ = stel.Frenet_to_cylindrical(0.05, ntheta=10)
+        R_2D_new, Z_2D_new, _ = new.Frenet_to_cylindrical(0.05, ntheta=10)
+        np.testing.assert_allclose(R_2D_3, R_2D_new, rtol=1e-13, atol=1e-13)
+        np.testing.assert_allclose(Z_2D_3, Z_2D_new, rtol=1e-13, atol=1e-13)
+        self.assertGreater(np.max(np.abs(R_2D_3 - R_2D_2)), 1e-4)
+
 if __name__ == "__main__":
     unittest.main()
@@ -18,5 +18,39 @@ class FourierMinimizeTests(unittest.TestCase):
                     min = fourier_minimum(y)
                     self.assertAlmostEqual(min, const - amplitude, places=14)
 
+class ToFourierTests(unittest.TestCase):
+
+    def test_direct_sum(self):
+        """
+        The FFT-based to_Fourier should match an explicit sum over the grid,
+        for even and odd grid sizes and for modes beyond the grid resolution.
+        """
+        rng = np.random.default_rng(0)
+        nfp = 3
+        for ntheta in [10, 11]:
+            for nphi in [14, 15]:
+                for mpol, ntor in [(3, 4), (8, 9)]:
+                    R_2D = rng.standard_normal((ntheta, nphi))
+                    Z_2D = rng.standard_normal((ntheta, nphi))
+                    RBC, RBS, ZBC, ZBS = to_Fourier(R_2D, Z_2D, nfp, mpol, ntor, lasym=True)
+                    theta = np.linspace(0, 2 * np.pi, ntheta, endpoint=False)
+                    phi = np.linspace(0, 2 * np.pi / nfp, nphi, endpoint=False)
+                    phi2d, theta2d = np.meshgrid(phi, theta)
+                    factor = 2 / (ntheta * nphi)
+                    for m in range(mpol + 1):
+                        for n in range(-ntor, ntor + 1):
+                            if m == 0 and n < 1:
+                                continue
+                            angle = m * theta2d - n * nfp * phi2d
+                            factor2 = factor
+                            if np.mod(ntheta, 2) == 0 and m == ntheta / 2: factor2 = factor2 / 2
+                            if np.mod(nphi, 2) == 0 and abs(n) == nphi / 2: factor2 = factor2 / 2
+                            np.testing.assert_allclose(RBC[n + ntor, m], np.sum(R_2D * np.cos(angle)) * factor2, atol=1e-13)
+                            np.testing.assert_allclose(RBS[n + ntor, m], np.sum(R_2D * np.sin(angle)) * factor2, atol=1e-13)
+                            np.testing.assert_allclose(ZBC[n + ntor, m], np.sum(Z_2D * np.cos(angle)) * factor2, atol=1e-13)
+                            np.testing.assert_allclose(ZBS[n + ntor, m], np.sum(Z_2D * np.sin(angle)) * factor2, atol=1e-13)
+                    self.assertAlmostEqual(RBC[ntor, 0], np.mean(R_2D), places=13)
+                    self.assertAlmostEqual(ZBC[ntor, 0], np.mean(Z_2D), places=13)
+
 if __name__ == "__main__":
     unittest.main()
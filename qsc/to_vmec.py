@@ -7,6 +7,15 @@ import numpy as np
 from .Frenet_to_cylindrical import Frenet_to_cylindrical
 from .util import mu0, to_Fourier
 
+def _array_to_str(array):
+    """
+    Format a list or array as comma-separated values for a VMEC namelist,
+    with full precision for floats and without numpy's summarization of
+    large arrays.
+    """
+    return np.array2string(np.asarray(array), separator=', ', threshold=np.inf, max_line_width=np.inf,
+                           formatter={'int': str, 'float_kind': lambda x: f"{x:.16e}"})[1:-1]
+
 def to_vmec(self, filename, r=0.1, params=dict(), ntheta=20, ntorMax=14):
     """
     Outputs the near-axis configuration calculated with pyQSC to
@@ -62,7 +71,6 @@ def to_vmec(self, filename, r=0.1, params=dict(), ntheta=20, ntorMax=14):
     R_2D, Z_2D, phi0_2D = self.Frenet_to_cylindrical(r, ntheta)
     
     # Fourier transform the result.
-    # This is not a rate-limiting step, so for clarity of code, we don't bother with an FFT.
     RBC, RBS, ZBC, ZBS = to_Fourier(R_2D, Z_2D, self.nfp, mpol, ntor, self.lasym)
 
     # Write to VMEC file
@@ -77,9 +85,9 @@ def to_vmec(self, filename, r=0.1, params=dict(), ntheta=20, ntorMax=14):
     file_object.write('  DELT = '+str(params["delt"])+'\n')
     file_object.write('  NSTEP = '+str(params["nstep"])+'\n')
     file_object.write('  TCON0 = '+str(params["tcon0"])+'\n')
-    file_object.write('  NS_ARRAY = '+str(params["ns_array"])[1:-1]+'\n')
-    file_object.write('  FTOL_ARRAY = '+str(params["ftol_array"])[1:-1]+'\n')
-    file_object.write('  NITER_ARRAY = '+str(params["niter_array"])[1:-1]+'\n')
+    file_object.write('  NS_ARRAY = '+_array_to_str(params["ns_array"])+'\n')
+    file_object.write('  FTOL_ARRAY = '+_array_to_str(params["ftol_array"])+'\n')
+    file_object.write('  NITER_ARRAY = '+_array_to_str(params["niter_array"])+'\n')
     file_object.write('!----- Grid Parameters -----\n')
     file_object.write('  LASYM = '+str(self.lasym)+'\n')
     file_object.write('  NFP = '+str(self.nfp)+'\n')
@@ -89,28 +97,33 @@ def to_vmec(self, filename, r=0.1, params=dict(), ntheta=20, ntorMax=14):
     file_object.write('!----- Pressure Parameters -----\n')
     file_object.write('  PRES_SCALE = '+str(pres_scale)+'\n')
     file_object.write("  PMASS_TYPE = '"+pmass_type+"'\n")
-    file_object.write('  AM = '+str(am)[1:-1]+'\n')
+    file_object.write('  AM = '+_array_to_str(am)+'\n')
     file_object.write('!----- Current/Iota Parameters -----\n')
     file_object.write('  CURTOR = '+str(curtor)+'\n')
     file_object.write('  NCURR = '+str(ncurr)+'\n')
     file_object.write("  PCURR_TYPE = '"+pcurr_type+"'\n")
-    file_object.write('  AC = '+str(ac)[1:-1]+'\n')
+    file_object.write('  AC = '+_array_to_str(ac)+'\n')
     file_object.write('!----- Axis Parameters -----\n')
     # To convert sin(...) modes to vmec, we introduce a minus sign. This is because in vmec,
     # R and Z ~ sin(m theta - n phi), which for m=0 is sin(-n phi) = -sin(n phi).
-    file_object.write('  RAXIS_CC = '+str(self.rc)[1:-1]+'\n')
+    file_object.write('  RAXIS_CC = '+_array_to_str(self.rc)+'\n')
     if self.lasym:
-        file_object.write('  RAXIS_CS = '+str(-self.rs)[1:-1]+'\n')
-        file_object.write('  ZAXIS_CC = '+str(self.zc)[1:-1]+'\n')
-    file_object.write('  ZAXIS_CS = '+str(-self.zs)[1:-1]+'\n')
+        file_object.write('  RAXIS_CS = '+_array_to_str(-self.rs)+'\n')
+        file_object.write('  ZAXIS_CC = '+_array_to_str(self.zc)+'\n')
+    file_object.write('  ZAXIS_CS = '+_array_to_str(-self.zs)+'\n')
     file_object.write('!----- Boundary Parameters -----\n')
-    for m in range(mpol+1):
-        for n in range(-ntor,ntor+1):
-            if RBC[n+ntor,m]!=0 or ZBS[n+ntor,m]!=0:
-                file_object.write(    '  RBC('+f"{n:03d}"+','+f"{m:03d}"+') = '+f"{RBC[n+ntor,m]:+.16e}"+',    ZBS('+f"{n:03d}"+','+f"{m:03d}"+') = '+f"{ZBS[n+ntor,m]:+.16e}"+'\n')
-                if self.lasym:
-                    file_object.write('  RBS('+f"{n:03d}"+','+f"{m:03d}"+') = '+f"{RBS[n+ntor,m]:+.16e}"+',    ZBC('+f"{n:03d}"+','+f"{m:03d}"+') = '+f"{ZBC[n+ntor,m]:+.16e}"+'\n')
-    file_object.write('/\n')
+    # Collect the boundary lines and write them all at once.
+    # Only the modes with RBC or ZBS nonzero are written; the mask is
+    # transposed so the modes are ordered by m first, then by n.
+    nonzero = np.argwhere(((RBC != 0) | (ZBS != 0)).transpose())
+    lines = []
+    for m, n_index in nonzero:
+        n = n_index - ntor
+        lines.append(    f"  RBC({n:03d},{m:03d}) = {RBC[n_index,m]:+.16e},    ZBS({n:03d},{m:03d}) = {ZBS[n_index,m]:+.16e}\n")
+        if self.lasym:
+            lines.append(f"  RBS({n:03d},{m:03d}) = {RBS[n_index,m]:+.16e},    ZBC({n:03d},{m:03d}) = {ZBC[n_index,m]:+.16e}\n")
+    lines.append('/\n')
+    file_object.writelines(lines)
     file_object.close()
 
     self.RBC = RBC.transpose()
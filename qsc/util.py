@@ -8,7 +8,6 @@ import logging
 import numpy as np
 import scipy.optimize
 from qsc.fourier_interpolation import fourier_interpolation
-from scipy.interpolate import CubicSpline as spline
 
 #logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -84,29 +83,27 @@ def to_Fourier(R_2D, Z_2D, nfp, mpol, ntor, lasym):
     shape = np.array(R_2D).shape
     ntheta = shape[0]
     nphi_conversion = shape[1]
-    theta = np.linspace(0, 2 * np.pi, ntheta, endpoint=False)
-    phi_conversion = np.linspace(0, 2 * np.pi / nfp, nphi_conversion, endpoint=False)
-    RBC = np.zeros((int(2 * ntor + 1), int(mpol + 1)))
-    RBS = np.zeros((int(2 * ntor + 1), int(mpol + 1)))
-    ZBC = np.zeros((int(2 * ntor + 1), int(mpol + 1)))
-    ZBS = np.zeros((int(2 * ntor + 1), int(mpol + 1)))
     factor = 2 / (ntheta * nphi_conversion)
-    phi2d, theta2d = np.meshgrid(phi_conversion, theta)
-    for m in range(mpol+1):
-        nmin = -ntor
-        if m==0: nmin = 1
-        for n in range(nmin, ntor+1):
-            angle = m * theta2d - n * nfp * phi2d
-            sinangle = np.sin(angle)
-            cosangle = np.cos(angle)
-            factor2 = factor
-            # The next 2 lines ensure inverse Fourier transform(Fourier transform) = identity
-            if np.mod(ntheta,2) == 0 and m  == (ntheta/2): factor2 = factor2 / 2
-            if np.mod(nphi_conversion,2) == 0 and abs(n) == (nphi_conversion/2): factor2 = factor2 / 2
-            RBC[n + ntor, m] = np.sum(R_2D * cosangle * factor2)
-            RBS[n + ntor, m] = np.sum(R_2D * sinangle * factor2)
-            ZBC[n + ntor, m] = np.sum(Z_2D * cosangle * factor2)
-            ZBS[n + ntor, m] = np.sum(Z_2D * sinangle * factor2)
+    # On the uniform (theta, phi) grid, the sums of R and Z times
+    # exp(-i (m theta - n nfp phi)) are entries of the 2D discrete
+    # Fourier transform, taken modulo the grid size for modes that
+    # the grid cannot resolve.
+    m = np.arange(mpol + 1)
+    n = np.arange(-ntor, ntor + 1)
+    m_index = np.mod(m, ntheta)[None, :]
+    n_index = np.mod(-n, nphi_conversion)[:, None]
+    factor2 = np.full((2 * ntor + 1, mpol + 1), factor)
+    # The next 2 lines ensure inverse Fourier transform(Fourier transform) = identity
+    if np.mod(ntheta,2) == 0: factor2[:, m == (ntheta/2)] /= 2
+    if np.mod(nphi_conversion,2) == 0: factor2[np.abs(n) == (nphi_conversion/2), :] /= 2
+    # The m=0, n<1 modes are redundant, apart from the n=0 constant set below:
+    factor2[n < 1, 0] = 0
+    # Transform R and Z together in a single batched FFT:
+    R_hat, Z_hat = np.fft.fft2(np.array([R_2D, Z_2D]))[:, m_index, n_index]
+    RBC = R_hat.real * factor2
+    RBS = -R_hat.imag * factor2
+    ZBC = Z_hat.real * factor2
+    ZBS = -Z_hat.imag * factor2
     RBC[ntor,0] = np.sum(R_2D) / (ntheta * nphi_conversion)
     ZBC[ntor,0] = np.sum(Z_2D) / (ntheta * nphi_conversion)
 
@@ -134,17 +131,21 @@ def B_mag(self, r, theta, phi, Boozer_toroidal = False):
     else:
         thetaN = theta - (self.iota - self.iotaN) * phi
 
-    B = self.B0*(1 + r * self.etabar * np.cos(thetaN))
+    costhetaN = np.cos(thetaN)
+    B = self.B0*(1 + r * self.etabar * costhetaN)
 
     # Add O(r^2) terms if necessary:
     if self.order != 'r1':
+        # Use the double-angle formulas rather than evaluating cos and sin of 2*thetaN:
+        sinthetaN = np.sin(thetaN)
+        cos2thetaN = 1 - 2 * sinthetaN * sinthetaN
+        sin2thetaN = 2 * sinthetaN * costhetaN
+        # The B20 splines are built once in calculate_r2, not on every call:
         if Boozer_toroidal == False:
-            self.B20_spline = self.convert_to_spline(self.B20)
+            B20 = self.B20_spline(phi)
         else:
-            self.B20_spline = spline(np.append(self.varphi, 2 * np.pi / self.nfp),
-                                     np.append(self.B20, self.B20[0]),
-                                     bc_type='periodic')
+            B20 = self.B20_varphi_spline(phi)
 
-        B += (r**2) * (self.B20_spline(phi) + self.B2c * np.cos(2 * thetaN) + self.B2s * np.sin(2 * thetaN))
+        B += (r**2) * (B20 + self.B2c * cos2thetaN + self.B2s * sin2thetaN)
 
     return B